@@ -16,11 +16,27 @@ import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    # Optional fast JSON codec for control/inbox files.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional MessagePack codec matching the daemon's snapshot mirror.
+    import msgspec.msgpack
+
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder()
+except ImportError:
+    msgspec = None
+    _MSGPACK_DECODER = None
+
 from gpuscheduler.daemon import runner
 from gpuscheduler.daemon.job import Job
 from gpuscheduler.serve import (
     DEFAULT_DB_PATH,
     DEFAULT_PID_FILE,
+    encodeJobBytes,
     isProcessAlive,
     parseGpuIndices,
     readPidFile,
@@ -31,6 +47,7 @@ from gpuscheduler.storage.sqliteStore import SQLiteJobStore
 INBOX_DIR = Path("inbox")
 CONTROL_DIR = Path("control")
 STATE_FILE = Path("state/snapshot.json")
+STATE_FILE_MP = Path("state/snapshot.mp")
 DEFAULT_DAEMON_LOG = Path("state/daemon.log")
 
 
@@ -70,15 +87,19 @@ def _jobGpuList(jobDict: Dict) -> List[int]:
 def _writeJobToInbox(job: Job) -> None:
     INBOX_DIR.mkdir(parents=True, exist_ok=True)
     filePath = INBOX_DIR / f"{job.id}.json"
-    with filePath.open("w") as f:
-        json.dump(job.toDict(), f, indent=2)
+    # Same wire codec the daemon decodes with; keeps the two sides from
+    # drifting apart.
+    filePath.write_bytes(encodeJobBytes(job))
 
 
 def _writeCancelRequest(jobId: str) -> None:
     CONTROL_DIR.mkdir(parents=True, exist_ok=True)
     filePath = CONTROL_DIR / f"cancel_{jobId}.json"
-    with filePath.open("w") as f:
-        json.dump({"jobId": jobId}, f)
+    if orjson is not None:
+        filePath.write_bytes(orjson.dumps({"jobId": jobId}))
+    else:
+        with filePath.open("w") as f:
+            json.dump({"jobId": jobId}, f)
 
 
 def _printJobsHeader(title: str) -> None:
@@ -125,10 +146,25 @@ def _printStatusSnapshot(snapshot: Dict, includeTerminal: bool = False) -> None:
 
 
 def _readSnapshot() -> Dict:
+    if _MSGPACK_DECODER is not None:
+        # Trust the mirror only when it is at least as fresh as the JSON
+        # snapshot: a daemon running without msgspec rewrites only
+        # snapshot.json, and a leftover mirror from an earlier run must
+        # not shadow it.
+        try:
+            mirrorMtime = STATE_FILE_MP.stat().st_mtime
+            jsonMtime = (
+                STATE_FILE.stat().st_mtime if STATE_FILE.exists() else None
+            )
+            if jsonMtime is None or mirrorMtime >= jsonMtime:
+                return _MSGPACK_DECODER.decode(STATE_FILE_MP.read_bytes())
+        except Exception:
+            # Missing or torn mirror: fall through to the JSON snapshot.
+            pass
     if not STATE_FILE.exists():
         return {"queued": [], "running": [], "terminal": []}
-    with STATE_FILE.open("r") as f:
-        return json.load(f)
+    raw = STATE_FILE.read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
 
 def _waitForProcessExit(pid: int, timeoutSeconds: float) -> bool:
@@ -11,21 +11,59 @@ Now includes:
 
 from __future__ import annotations
 
+import queue
 import threading
+import types
 import subprocess
 import time
 import platform
 import sys
 import os
 import shutil
-from typing import Callable, Dict, Optional, Any, List
+from typing import Callable, Dict, Optional, Any, List, Sequence
+
+try:
+    # Optional NVML bindings (nvidia-ml-py); direct C-API calls avoid a
+    # nvidia-smi fork/exec + CSV parse on every poll.
+    import pynvml
+except ImportError:
+    pynvml = None
+
+_nvmlHandles: Optional[List[Any]] = None
+
+# Debug mode cannot change mid-process; parse the env var once at import
+# instead of on every runCmd invocation.
+_DEBUG = int(os.environ.get("GPUSCHED_DEBUG", "0")) == 1
+
+
+def _getNvmlHandles() -> Optional[List[Any]]:
+    """Initialize NVML once and cache the per-device handles."""
+    global _nvmlHandles, pynvml
+
+    if pynvml is None:
+        return None
+    if _nvmlHandles is not None:
+        return _nvmlHandles
+
+    try:
+        pynvml.nvmlInit()
+        _nvmlHandles = [
+            pynvml.nvmlDeviceGetHandleByIndex(i)
+            for i in range(pynvml.nvmlDeviceGetCount())
+        ]
+    except Exception:
+        # No NVIDIA driver present; disable the NVML path for this process.
+        pynvml = None
+        return None
+
+    return _nvmlHandles
 
 
 # ----------------------------------------------------
 # Command Runner
 # ----------------------------------------------------
 
-def runCmd(cmd: list[str], timeout: float = 1.5) -> Optional[str]:
+def runCmd(cmd: Sequence[str], timeout: float = 1.5) -> Optional[str]:
     try:
         proc = subprocess.run(
             cmd,
@@ -34,7 +72,7 @@ def runCmd(cmd: list[str], timeout: float = 1.5) -> Optional[str]:
             text=True,
             timeout=timeout,
         )
-        if int(os.environ.get("GPUSCHED_DEBUG", "0")) == 1:
+        if _DEBUG:
             debugMsg = [
                 "[runCmd-debug] CMD: " + " ".join(cmd),
                 f"RET: {proc.returncode}",
@@ -51,7 +89,7 @@ def runCmd(cmd: list[str], timeout: float = 1.5) -> Optional[str]:
         return None
 
     except (subprocess.SubprocessError, FileNotFoundError, PermissionError) as e:
-        if int(os.environ.get("GPUSCHED_DEBUG", "0")) == 1:
+        if _DEBUG:
             print(f"[runCmd-debug] EXC: {e}", file=sys.stderr)
         return None
 
@@ -60,15 +98,45 @@ def runCmd(cmd: list[str], timeout: float = 1.5) -> Optional[str]:
 # NVIDIA Stats
 # ----------------------------------------------------
 
+def nvmlStatsAll() -> Optional[Dict[str, Any]]:
+    handles = _getNvmlHandles()
+    if not handles:
+        return None
+
+    gpus: List[Dict[str, Any]] = []
+    try:
+        for idx, handle in enumerate(handles):
+            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
+            mem = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            gpus.append(
+                {
+                    "index": idx,
+                    "gpuUtilPercent": float(util.gpu),
+                    "gpuMemUsedMb": mem.used / (1024.0 * 1024.0),
+                    "gpuMemTotalMb": mem.total / (1024.0 * 1024.0),
+                    "gpuMemUtilPercent": float(util.memory),
+                }
+            )
+    except Exception:
+        return None
+
+    if not gpus:
+        return None
+
+    # Same snapshot shape and backend tag as the nvidia-smi path so all
+    # consumers keep working regardless of which source produced it.
+    return {"backend": "nvidia-smi", "gpus": gpus, "raw": ""}
+
+
+_NVIDIA_SMI_CMD = (
+    "nvidia-smi",
+    "--query-gpu=index,memory.used,memory.total,utilization.gpu,utilization.memory",
+    "--format=csv,noheader,nounits",
+)
+
+
 def nvidiaStatsAll() -> Optional[Dict[str, Any]]:
-    out = runCmd(
-        [
-            "nvidia-smi",
-            "--query-gpu=index,memory.used,memory.total,utilization.gpu,utilization.memory",
-            "--format=csv,noheader,nounits",
-        ],
-        timeout=1.5,
-    )
+    out = runCmd(_NVIDIA_SMI_CMD, timeout=1.5)
 
     if not out:
         return None
@@ -76,20 +144,16 @@ def nvidiaStatsAll() -> Optional[Dict[str, Any]]:
     gpus: List[Dict[str, Any]] = []
 
     for line in out.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-
-        parts = [p.strip() for p in line.split(",")]
-        if len(parts) < 5:
-            continue
-
+        # Single split with positional unpack; int()/float() already
+        # tolerate surrounding whitespace, so no per-part strip is needed.
+        # Blank or short lines fail the unpack and are skipped below.
         try:
-            idx = int(parts[0])
-            memUsedMb = float(parts[1])
-            memTotalMb = float(parts[2])
-            utilGpuPct = float(parts[3])
-            utilMemPct = float(parts[4])
+            idxS, memUsedS, memTotalS, utilGpuS, utilMemS = line.split(",", 4)
+            idx = int(idxS)
+            memUsedMb = float(memUsedS)
+            memTotalMb = float(memTotalS)
+            utilGpuPct = float(utilGpuS)
+            utilMemPct = float(utilMemS)
         except ValueError:
             continue
 
@@ -113,9 +177,14 @@ def nvidiaStatsAll() -> Optional[Dict[str, Any]]:
 # macOS powermetrics Stats
 # ----------------------------------------------------
 
-def powermetricsStats() -> Optional[Dict[str, Any]]:
-    if sys.platform != "darwin" or "arm" not in platform.machine().lower():
-        return None
+_powermetricsCmd: Optional[Sequence[str]] = None
+
+
+def _getPowermetricsCmd() -> Sequence[str]:
+    """Resolve the powermetrics command once; path and euid do not change."""
+    global _powermetricsCmd
+    if _powermetricsCmd is not None:
+        return _powermetricsCmd
 
     pmPath = shutil.which("powermetrics")
     if pmPath is None:
@@ -132,12 +201,19 @@ def powermetricsStats() -> Optional[Dict[str, Any]]:
         isRoot = False
 
     if isRoot:
-        cmd = [pmPath, "--samplers", "gpu_power", "-n", "1"]
+        _powermetricsCmd = (pmPath, "--samplers", "gpu_power", "-n", "1")
     else:
         # Non-interactive sudo prevents daemon hangs waiting for a password prompt.
-        cmd = ["sudo", "-n", pmPath, "--samplers", "gpu_power", "-n", "1"]
+        _powermetricsCmd = ("sudo", "-n", pmPath, "--samplers", "gpu_power", "-n", "1")
+
+    return _powermetricsCmd
+
+
+def powermetricsStats() -> Optional[Dict[str, Any]]:
+    if sys.platform != "darwin" or "arm" not in platform.machine().lower():
+        return None
 
-    out = runCmd(cmd, timeout=15.0)
+    out = runCmd(_getPowermetricsCmd(), timeout=15.0)
     if not out:
         return None
 
@@ -164,7 +240,9 @@ def powermetricsStats() -> Optional[Dict[str, Any]]:
 def getGpuStatsSnapshot() -> Dict[str, Any]:
     ts = time.time()
 
-    n = nvidiaStatsAll()
+    n = nvmlStatsAll()
+    if n is None:
+        n = nvidiaStatsAll()
     if n is not None:
         n["timestamp"] = ts
         return n
@@ -192,33 +270,64 @@ class Monitor:
         self.pollInterval = float(pollInterval)
         self.callback = callback
         self.utilDeltaThreshold = utilDeltaThreshold
+        # Utilization is quantized to whole percent for delta detection;
+        # integer compares keep the threshold behavior deterministic.
+        self._utilDeltaThresholdInt = int(utilDeltaThreshold)
 
         self._lastLock = threading.Lock()
         self._lastSnapshot: Optional[Dict[str, Any]] = None
 
-        self._previousUtil: Optional[float] = None
+        self._previousUtil: Optional[int] = None
 
         self._stopEvent = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
+        # Callback dispatch is decoupled from polling: snapshots go through
+        # a small bounded queue to a consumer thread so a slow callback
+        # cannot stall the sampling cadence. Oldest entries are dropped on
+        # overflow ("latest snapshot wins").
+        self._callbackQueue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(
+            maxsize=4
+        )
+        self._callbackThread: Optional[threading.Thread] = None
+
+        # Backend is fixed per system, so dispatch to the matching
+        # extractor once and only re-resolve if the backend tag changes.
+        self._cachedBackend: Optional[str] = None
+        self._cachedExtractor: Optional[Callable[[Dict[str, Any]], float]] = None
+
     # ----------------------------------------------------
     # Util Extraction
     # ----------------------------------------------------
 
+    @staticmethod
+    def _extractNvidiaUtil(snap: Dict[str, Any]) -> float:
+        return max(
+            (g.get("gpuUtilPercent", 0.0) for g in snap.get("gpus", ())),
+            default=0.0,
+        )
+
+    @staticmethod
+    def _extractPowermetricsUtil(snap: Dict[str, Any]) -> float:
+        return snap.get("gpuUtilPercent", 0.0) or 0.0
+
+    _extractorsByBackend = {
+        "nvidia-smi": _extractNvidiaUtil.__func__,
+        "powermetrics": _extractPowermetricsUtil.__func__,
+    }
+
     def _extractUtil(self, snap: Dict[str, Any]) -> float:
         if not snap:
             return 0.0
 
-        if snap.get("backend") == "nvidia-smi":
-            gpus = snap.get("gpus", [])
-            if not gpus:
-                return 0.0
-            return max(g.get("gpuUtilPercent", 0.0) for g in gpus)
-
-        if snap.get("backend") == "powermetrics":
-            return snap.get("gpuUtilPercent", 0.0) or 0.0
+        backend = snap.get("backend")
+        if backend != self._cachedBackend:
+            self._cachedBackend = backend
+            self._cachedExtractor = self._extractorsByBackend.get(backend)
 
-        return 0.0
+        if self._cachedExtractor is None:
+            return 0.0
+        return self._cachedExtractor(snap)
 
     # ----------------------------------------------------
     # Background Loop
@@ -226,32 +335,60 @@ class Monitor:
 
     def _loop(self):
         while not self._stopEvent.is_set():
-            snap = getGpuStatsSnapshot()
+            # Freeze the snapshot before publishing: readers get the same
+            # reference back without a defensive copy, and any accidental
+            # in-place mutation raises instead of corrupting shared state.
+            snap = types.MappingProxyType(getGpuStatsSnapshot())
 
             with self._lastLock:
                 self._lastSnapshot = snap
 
             if self.callback:
-                currentUtil = self._extractUtil(snap)
+                currentUtil = int(self._extractUtil(snap))
 
                 shouldNotify = False
 
                 if self._previousUtil is None:
                     shouldNotify = True
-                elif abs(currentUtil - self._previousUtil) >= self.utilDeltaThreshold:
+                elif abs(currentUtil - self._previousUtil) >= self._utilDeltaThresholdInt:
                     shouldNotify = True
 
                 if shouldNotify:
                     self._previousUtil = currentUtil
-                    try:
-                        self.callback(snap)
-                    except Exception:
-                        pass
+                    self._enqueueCallback(snap)
 
-            slept = 0.0
-            while slept < self.pollInterval and not self._stopEvent.is_set():
-                time.sleep(0.2)
-                slept += 0.2
+            # Interruptible sleep: returns True (and we exit) the moment
+            # stop() sets the event, instead of polling it 5x per interval.
+            if self._stopEvent.wait(self.pollInterval):
+                break
+
+    # ----------------------------------------------------
+    # Callback Dispatch
+    # ----------------------------------------------------
+
+    def _enqueueCallback(self, snap: Dict[str, Any]) -> None:
+        try:
+            self._callbackQueue.put_nowait(snap)
+        except queue.Full:
+            try:
+                self._callbackQueue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._callbackQueue.put_nowait(snap)
+            except queue.Full:
+                pass
+
+    def _dispatchLoop(self):
+        while True:
+            snap = self._callbackQueue.get()
+            if snap is None:
+                break
+            if self.callback:
+                try:
+                    self.callback(snap)
+                except Exception:
+                    pass
 
     # ----------------------------------------------------
     # Lifecycle
@@ -262,6 +399,17 @@ class Monitor:
             return
 
         self._stopEvent.clear()
+
+        if self.callback and not (
+            self._callbackThread and self._callbackThread.is_alive()
+        ):
+            self._callbackThread = threading.Thread(
+                target=self._dispatchLoop,
+                name="gpusched-monitor-dispatch",
+                daemon=True,
+            )
+            self._callbackThread.start()
+
         self._thread = threading.Thread(
             target=self._loop,
             name="gpusched-monitor",
@@ -274,8 +422,15 @@ class Monitor:
         if self._thread:
             self._thread.join(timeout=timeout)
             self._thread = None
+        if self._callbackThread:
+            # Sentinel unblocks the dispatcher even with an empty queue.
+            self._enqueueCallback(None)
+            self._callbackThread.join(timeout=timeout)
+            self._callbackThread = None
 
     def getLastStats(self) -> Optional[Dict[str, Any]]:
+        # Snapshots are immutable once published, so the reference can be
+        # handed out directly; no per-read shallow copy.
         with self._lastLock:
-            return None if self._lastSnapshot is None else dict(self._lastSnapshot)
+            return self._lastSnapshot
         
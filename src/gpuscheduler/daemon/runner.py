@@ -14,21 +14,34 @@ Features:
 
 from __future__ import annotations
 
+import functools
 import os
+import selectors
 import signal
 import subprocess
 import time
 import shlex
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 from gpuscheduler.daemon.job import Job
 
 
-_processTable: Dict[int, subprocess.Popen] = {}
-_jobByPid: Dict[int, Job] = {}
+# Single process table keyed by pid: O(1) lookup, cheap full scans, and
+# — critically — every operation on it (get/set/pop/list()) is a single
+# GIL-atomic dict op. The scheduler thread (start/poll) and the serve
+# thread (cancel -> terminate) both touch this table, so a list +
+# swap-remove index would need a lock to avoid reading a stale row.
+_procs: Dict[int, Tuple[subprocess.Popen, Job]] = {}
 
 DEFAULT_LOG_DIR = "/tmp/gpusched"
 
+# Base environment captured once; startJob copies and augments it per
+# launch instead of re-copying os.environ (a ~100-entry dict) every time.
+_BASE_ENV = dict(os.environ)
+
+# Repeated submissions of the same command (sweeps) reuse the parse.
+_splitCmd = functools.lru_cache(maxsize=512)(shlex.split)
+
 
 # ----------------------------------------------------
 # Utilities
@@ -67,9 +80,16 @@ def startJob(
 
     _ensureLogDir(logDir)
     logPath = _getLogPath(job.id, logDir)
-    logFile = open(logPath, "ab", buffering=0)
+    # Raw append fd instead of a Python file object: skips the io stack,
+    # and O_CLOEXEC keeps the fd out of unrelated children. Popen dups it
+    # for the child, so it is closed again right after spawn.
+    logFd = os.open(
+        logPath,
+        os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0),
+        0o644,
+    )
 
-    env = os.environ.copy()
+    env = _BASE_ENV.copy()
 
     assignedGpuIndices: List[int] = []
     if gpuIndices:
@@ -92,11 +112,13 @@ def startJob(
 
     env["GPUSCHED_JOB_ID"] = job.id
 
-    # Properly split command into arguments
-    cmd = shlex.split(job.command)
+    # Properly split command into arguments (cached per command string).
+    # Copy the cached list so no caller can mutate the shared entry and
+    # poison later launches of the same command.
+    cmd = list(_splitCmd(job.command))
 
     popenArgs = {
-        "stdout": logFile,
+        "stdout": logFd,
         "stderr": subprocess.STDOUT,
         "stdin": subprocess.DEVNULL,
         "env": env,
@@ -112,12 +134,14 @@ def startJob(
         )
 
     # IMPORTANT: shell=False (default)
-    proc = subprocess.Popen(cmd, **popenArgs)
+    try:
+        proc = subprocess.Popen(cmd, **popenArgs)
+    finally:
+        os.close(logFd)
 
     pid = proc.pid
 
-    _processTable[pid] = proc
-    _jobByPid[pid] = job
+    _procs[pid] = (proc, job)
 
     return pid
 
@@ -127,16 +151,31 @@ def startJob(
 # ----------------------------------------------------
 
 def pollJob(pid: int) -> Optional[int]:
-    proc = _processTable.get(pid)
-    if not proc:
+    row = _procs.get(pid)
+    if row is None:
         return None
-    return proc.poll()
+    return row[0].poll()
 
 
 def isAlive(pid: int) -> bool:
     return pollJob(pid) is None
 
 
+def pollFinished() -> Dict[int, int]:
+    """
+    Poll every tracked process in one pass over the table.
+    Returns {pid: exitCode} for processes that have exited.
+    """
+    finished: Dict[int, int] = {}
+    # list() snapshots the items atomically so concurrent terminations
+    # cannot perturb the iteration.
+    for pid, (proc, _job) in list(_procs.items()):
+        code = proc.poll()
+        if code is not None:
+            finished[pid] = code
+    return finished
+
+
 # ----------------------------------------------------
 # Signals & Control
 # ----------------------------------------------------
@@ -175,38 +214,63 @@ def sendPreemptSignal(pid: int) -> bool:
 # Termination
 # ----------------------------------------------------
 
-def terminateJob(pid: int, timeout: float = 5.0) -> Optional[int]:
-    if pid not in _processTable:
-        return None
+def _waitForExit(pid: int, timeout: float) -> Optional[int]:
+    """
+    Wait up to timeout seconds for pid to exit.
+    Returns the exit code, or None if the process is still alive.
+    """
 
-    sendSignal(pid, signal.SIGTERM)
+    if hasattr(os, "pidfd_open"):
+        # Linux 5.3+: sleep on the pidfd until the process actually exits
+        # (the fd becomes readable) instead of waking every 250ms to poll.
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError:
+            # Process already gone (or pidfd unsupported for it).
+            return pollJob(pid)
+
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(fd, selectors.EVENT_READ)
+            sel.select(timeout)
+        finally:
+            sel.close()
+            os.close(fd)
+        return pollJob(pid)
 
     waited = 0.0
     while waited < timeout:
         code = pollJob(pid)
         if code is not None:
-            _cleanup(pid)
             return code
         time.sleep(0.25)
         waited += 0.25
+    return pollJob(pid)
+
+
+def terminateJob(pid: int, timeout: float = 5.0) -> Optional[int]:
+    if pid not in _procs:
+        return None
+
+    sendSignal(pid, signal.SIGTERM)
+
+    code = _waitForExit(pid, timeout)
+    if code is not None:
+        _cleanup(pid)
+        return code
 
     sendSignal(pid, signal.SIGKILL)
 
-    waited = 0.0
-    while waited < 2.0:
-        code = pollJob(pid)
-        if code is not None:
-            _cleanup(pid)
-            return code
-        time.sleep(0.25)
-        waited += 0.25
+    code = _waitForExit(pid, 2.0)
+    if code is not None:
+        _cleanup(pid)
+        return code
 
     return None
 
 
 def _cleanup(pid: int) -> None:
-    _processTable.pop(pid, None)
-    _jobByPid.pop(pid, None)
+    _procs.pop(pid, None)
 
 
 # ----------------------------------------------------
@@ -214,10 +278,10 @@ def _cleanup(pid: int) -> None:
 # ----------------------------------------------------
 
 def checkRuntimeExceeded(pid: int) -> bool:
-    job = _jobByPid.get(pid)
-    if not job:
+    row = _procs.get(pid)
+    if row is None:
         return False
-    return job.hasExceededRuntime()
+    return row[1].hasExceededRuntime()
 
 
 # ----------------------------------------------------
@@ -227,11 +291,14 @@ def checkRuntimeExceeded(pid: int) -> bool:
 def readJobLogTail(jobId: str, logDir: str = DEFAULT_LOG_DIR, maxBytes: int = 4096) -> bytes:
     path = _getLogPath(jobId, logDir)
     try:
-        with open(path, "rb") as f:
-            f.seek(0, os.SEEK_END)
-            size = f.tell()
+        # fstat + pread replaces the seek/tell/seek/read chain: one size
+        # lookup and one positioned read, with no file-position mutation.
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
             toRead = min(size, maxBytes)
-            f.seek(size - toRead, os.SEEK_SET)
-            return f.read(toRead)
+            return os.pread(fd, toRead, size - toRead)
+        finally:
+            os.close(fd)
     except Exception:
         return b""
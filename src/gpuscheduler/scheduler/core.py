@@ -13,8 +13,16 @@ Features:
 
 from __future__ import annotations
 
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import selectors
+import sys
 import threading
 import time
+from dataclasses import dataclass
 from itertools import combinations
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
@@ -29,6 +37,38 @@ from gpuscheduler.security.attestor import MockAttestor, isAttestationCompliant
 from gpuscheduler.security.proof import ProofLedger, hashFile
 
 
+# Scheduler threads only enqueue log records; a background QueueListener
+# does the timestamp formatting and the (lock-taking, possibly flushing)
+# stdout write. Stdout is kept as the sink so daemon.log capture via
+# stream redirection keeps working.
+logger = logging.getLogger("gpuscheduler.scheduler")
+if not logger.handlers:
+    _logQueue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _streamHandler = logging.StreamHandler(sys.stdout)
+    _streamHandler.setFormatter(
+        logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+    )
+    _logListener = logging.handlers.QueueListener(_logQueue, _streamHandler)
+    _logListener.start()
+    # Drain the queue at interpreter exit so records logged during
+    # shutdown are not silently dropped.
+    atexit.register(_logListener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(_logQueue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+@dataclass(frozen=True, slots=True)
+class GpuView:
+    """Pre-indexed, immutable read model of one monitor snapshot."""
+
+    snapshot: Any
+    backend: Optional[str]
+    utilByGpu: Dict[int, float]
+    memUtilByGpu: Dict[int, Optional[float]]
+    freeMemByGpu: Dict[int, Optional[float]]
+
+
 class SchedulerCore:
 
     def __init__(
@@ -39,6 +79,8 @@ class SchedulerCore:
         fairSharePriorityPenalty: float = 0.75,
         placementMode: str = "fragmentation_aware",
         victimWeights: Optional[Dict[str, float]] = None,
+        pollInterval: float = 5.0,
+        idleWaitTimeout: Optional[float] = None,
     ):
         self.gpuIndices = gpuIndices or [0]
         self.agingFactor = max(0.0, float(agingFactor))
@@ -61,11 +103,28 @@ class SchedulerCore:
             for key, value in victimWeights.items():
                 self.victimWeights[key] = float(value)
 
+        # All state changes (submit/cancel/completion/monitor delta)
+        # notify the condition, so these intervals only bound wakeup
+        # latency when nothing at all is happening; GPU utilization does
+        # not change meaningfully below this cadence.
+        envPollInterval = os.environ.get("GPUSCHED_POLL_INTERVAL_SECONDS")
+        if envPollInterval:
+            try:
+                pollInterval = float(envPollInterval)
+            except ValueError:
+                pass
+        self.pollInterval = max(0.1, float(pollInterval))
+        self.idleWaitTimeout = (
+            self.pollInterval * 2.0
+            if idleWaitTimeout is None
+            else max(0.1, float(idleWaitTimeout))
+        )
+
         self.queueManager = QueueManager(agingFactor=self.agingFactor)
         self.policy = SchedulingPolicy()
 
         self.monitor = Monitor(
-            pollInterval=2.0,
+            pollInterval=self.pollInterval,
             callback=self._onMonitorUpdate,
             utilDeltaThreshold=10.0,
         )
@@ -75,14 +134,91 @@ class SchedulerCore:
 
         self._condition = threading.Condition()
         self._stop = False
+        # Set whenever job state changes (submit/cancel/start/finish/
+        # preempt) so the serve loop can sleep on it instead of polling
+        # at a fixed 1 Hz; consumers wait-with-timeout and clear it.
+        self.stateChanged = threading.Event()
+        # SPSC handoff from the inbox loader: producers put without
+        # touching the scheduler condition (SimpleQueue is C-level and
+        # reentrant); the scheduler drains everything pending in one pass
+        # at the top of each loop iteration.
+        self._inboxQueue: "queue.SimpleQueue[Job]" = queue.SimpleQueue()
+        # Linux: idle waits park in selector.select() on an eventfd and
+        # wakers do a lock-free 8-byte eventfd_write, avoiding the
+        # pthread_cond handshake. Elsewhere the Condition timeout wait is
+        # kept as the fallback; notifies are issued either way.
+        self._wakeFd: Optional[int] = None
+        self._wakeSelector: Optional[selectors.BaseSelector] = None
+        if hasattr(os, "eventfd"):
+            try:
+                self._wakeFd = os.eventfd(
+                    0,
+                    os.EFD_NONBLOCK | os.EFD_CLOEXEC,
+                )
+                self._wakeSelector = selectors.DefaultSelector()
+                self._wakeSelector.register(
+                    self._wakeFd,
+                    selectors.EVENT_READ,
+                )
+            except OSError:
+                self._wakeFd = None
+                self._wakeSelector = None
+        # Latest pre-indexed snapshot view. Built eagerly in the monitor
+        # callback and lazily for any other snapshot handed to the
+        # accessors; published by plain reference assignment, which is
+        # atomic, so readers never need a lock.
+        self._gpuView: Optional[GpuView] = None
         self._terminalJobsById: Dict[str, Job] = {}
         self._terminalOrder: List[str] = []
         self._terminalLock = threading.RLock()
 
     def _onMonitorUpdate(self, snapshot):
-        # Wake scheduler when GPU stats change
+        # Index the snapshot on the monitor dispatch thread so the
+        # scheduler finds it ready; only wake the scheduler when the
+        # change could actually alter a scheduling/preemption decision.
+        # The view is updated either way so the next natural pass reads
+        # fresh numbers.
+        newView = self._buildGpuView(snapshot)
+        oldView = self._gpuView
+        self._gpuView = newView
+
+        if oldView is not None and not self._isViewChangeActionable(
+            oldView, newView
+        ):
+            return
+
         with self._condition:
             self._condition.notify()
+        self._signalWake()
+
+    def _isViewChangeActionable(self, old: GpuView, new: GpuView) -> bool:
+        if old.backend != new.backend:
+            return True
+
+        if new.backend == "powermetrics":
+            oldUtil = old.snapshot.get("gpuUtilPercent", 0.0) or 0.0
+            newUtil = new.snapshot.get("gpuUtilPercent", 0.0) or 0.0
+            oldByGpu = {0: oldUtil}
+            newByGpu = {0: newUtil}
+        else:
+            oldByGpu = old.utilByGpu
+            newByGpu = new.utilByGpu
+
+        if newByGpu.keys() != oldByGpu.keys():
+            return True
+
+        spikeDelta = self.policy.spikeDelta
+        utilThreshold = self.policy.staticUtilThreshold
+        for gpu, newUtil in newByGpu.items():
+            oldUtil = oldByGpu[gpu]
+            if abs(newUtil - oldUtil) >= spikeDelta:
+                return True
+            # Crossing the schedulability boundary flips placement
+            # decisions even when the delta itself is small.
+            if (newUtil < utilThreshold) != (oldUtil < utilThreshold):
+                return True
+
+        return False
 
     # ----------------------------------------------------
     # Public API
@@ -98,11 +234,80 @@ class SchedulerCore:
             job.meta.setdefault("runTimeConsumedSeconds", 0.0)
             self.queueManager.addJob(job)
             self._condition.notify()
+        self._signalWake()
+        self.stateChanged.set()
+
+    def submitJobs(self, jobs: List[Job]) -> None:
+        """
+        Batch submit: one condition acquisition and one wake for the
+        whole burst instead of per-job lock traffic.
+        """
+        if not jobs:
+            return
+        with self._condition:
+            for job in jobs:
+                if not isinstance(job.meta, dict):
+                    job.meta = {}
+                if not job.meta.get("user"):
+                    job.meta["user"] = "default"
+                job.meta.setdefault("preemptionCount", 0)
+                job.meta.setdefault("runTimeConsumedSeconds", 0.0)
+                self.queueManager.addJob(job)
+            self._condition.notify()
+        self._signalWake()
+        self.stateChanged.set()
+
+    def enqueueJobs(self, jobs: List[Job]) -> None:
+        """
+        Hand a burst of jobs to the scheduler without taking its
+        condition: jobs land on the SPSC inbox queue and the scheduler
+        thread folds them into the queue manager before its next pass.
+        One wake covers the whole burst.
+        """
+        if not jobs:
+            return
+        for job in jobs:
+            self._inboxQueue.put(job)
+        self._wake()
+
+    def _drainInboxQueue(self) -> bool:
+        pending: List[Job] = []
+        while True:
+            try:
+                pending.append(self._inboxQueue.get_nowait())
+            except queue.Empty:
+                break
+        if not pending:
+            return False
+        self.submitJobs(pending)
+        return True
 
     def stop(self) -> None:
         with self._condition:
             self._stop = True
             self._condition.notify()
+        self._signalWake()
+        self._closeWakeFd()
+
+    def _closeWakeFd(self) -> None:
+        # Release the eventfd and its selector so repeatedly constructed
+        # cores (tests, embedders) do not leak two fds apiece. The wake
+        # above lands before the close, and _waitForWork tolerates the
+        # selector disappearing mid-wait; with _stop already set the run
+        # loop exits on its next pass either way.
+        selector, fd = self._wakeSelector, self._wakeFd
+        self._wakeSelector = None
+        self._wakeFd = None
+        if selector is not None:
+            try:
+                selector.close()
+            except OSError:
+                pass
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
 
     def getTerminalJobs(self) -> List[Job]:
         with self._terminalLock:
@@ -117,7 +322,7 @@ class SchedulerCore:
     # ----------------------------------------------------
 
     def run(self):
-        print("Starting SchedulerCore...")
+        logger.info("Starting SchedulerCore...")
         self.monitor.start()
 
         while True:
@@ -126,6 +331,9 @@ class SchedulerCore:
                 if self._stop:
                     break
 
+            # Phase 0: Fold handed-off submissions into the queue
+            self._drainInboxQueue()
+
             # Phase 1: Check for finished jobs
             finishedSomething = self._handleCompletions()
 
@@ -140,15 +348,42 @@ class SchedulerCore:
 
             # Wait for next event if nothing happened
             if not (finishedSomething or scheduled):
-                with self._condition:
-                    self._condition.wait(timeout=2.0)
+                self._waitForWork(self.idleWaitTimeout)
 
         self.monitor.stop()
-        print("Scheduler stopped.")
+        logger.info("Scheduler stopped.")
 
     def _wake(self) -> None:
         with self._condition:
             self._condition.notify()
+        self._signalWake()
+        self.stateChanged.set()
+
+    def _signalWake(self) -> None:
+        if self._wakeFd is None:
+            return
+        try:
+            os.eventfd_write(self._wakeFd, 1)
+        except (BlockingIOError, OSError):
+            # Counter saturated: a wake is already pending.
+            pass
+
+    def _waitForWork(self, timeout: float) -> None:
+        selector = self._wakeSelector
+        if selector is not None:
+            try:
+                selector.select(timeout)
+                fd = self._wakeFd
+                if fd is not None:
+                    # Drain the counter so the next select blocks again.
+                    os.eventfd_read(fd)
+            except (BlockingIOError, OSError, ValueError):
+                # Nothing pending, or stop() closed the fd mid-wait.
+                pass
+            return
+
+        with self._condition:
+            self._condition.wait(timeout=timeout)
 
     def _getJobUser(self, job: Job) -> str:
         user = job.meta.get("user")
@@ -247,6 +482,14 @@ class SchedulerCore:
     def _handleCompletions(self) -> bool:
         somethingChanged = False
 
+        # One pass over the runner's process table up front instead of a
+        # per-job pollJob round trip (table lookup + poll) below. A
+        # SIGCHLD/waitpid(-1) drain would be cheaper still, but the runner
+        # owns its children through subprocess.Popen (which must reap its
+        # own pids) and the scheduler loop runs off the main thread, where
+        # signal handlers cannot be installed.
+        finishedByPid = runner.pollFinished()
+
         for job in self.queueManager.getRunningJobs():
             if job.pid is None:
                 continue
@@ -268,16 +511,16 @@ class SchedulerCore:
                 self._recordTerminalJob(job)
                 somethingChanged = True
 
-                print(
-                    f"[{time.strftime('%H:%M:%S')}] "
-                    f"Job {job.id} failed: exceeded max runtime "
-                    f"({job.maxRuntimeSeconds}s)"
+                logger.info(
+                    "Job %s failed: exceeded max runtime (%ss)",
+                    job.id,
+                    job.maxRuntimeSeconds,
                 )
 
                 self._wake()
                 continue
 
-            exitCode = runner.pollJob(job.pid)
+            exitCode = finishedByPid.get(job.pid)
             if exitCode is not None:
                 gpuIndex = self._getPrimaryAssignedGpu(job)
                 job.meta["runTimeConsumedSeconds"] = self._runtimeSeconds(job)
@@ -293,9 +536,10 @@ class SchedulerCore:
                 self._recordTerminalJob(job)
                 somethingChanged = True
 
-                print(
-                    f"[{time.strftime('%H:%M:%S')}] "
-                    f"Job {job.id} finished with exit code {exitCode}"
+                logger.info(
+                    "Job %s finished with exit code %s",
+                    job.id,
+                    exitCode,
                 )
 
                 self._wake()
@@ -311,8 +555,14 @@ class SchedulerCore:
         if snapshot is None:
             return False
 
+        # One wall reading for aging and one monotonic reading for policy
+        # cooldowns per pass, instead of a clock call per job/GPU.
+        nowWall = time.time()
+        nowMono = time.monotonic()
+
         queuedJobs = self.queueManager.getQueuedJobs(
             agingFactor=self.agingFactor,
+            now=nowWall,
             includePaused=True,
             fairnessPenaltyByUser=self._buildUserFairnessPenalty(),
         )
@@ -333,6 +583,7 @@ class SchedulerCore:
             candidate,
             snapshot,
             enforcePolicy=True,
+            now=nowMono,
         ) is not None:
             return False
 
@@ -343,11 +594,11 @@ class SchedulerCore:
         )
         if memoryVictims is not None:
             targetGpus, victims = memoryVictims
-            print(
-                f"[{time.strftime('%H:%M:%S')}] "
-                f"Memory preemption on GPUs {targetGpus} "
-                f"for job {candidate.id}: "
-                f"{[job.id for job in victims]}"
+            logger.info(
+                "Memory preemption on GPUs %s for job %s: %s",
+                targetGpus,
+                candidate.id,
+                [job.id for job in victims],
             )
             self._preemptJobs(
                 victims=victims,
@@ -360,6 +611,13 @@ class SchedulerCore:
         # Smart victim selection for priority preemption.
         candidateVictims: Dict[str, Job] = {}
         for gpuIndex in self.gpuIndices:
+            # O(1) prefilter: if even the lowest-priority occupant outranks
+            # the candidate, no job on this GPU can be a victim — skip the
+            # per-job scan (and the running-list copy) entirely.
+            lowest = self.queueManager.peekLowestPriorityRunning(gpuIndex)
+            if lowest is None or candidate.priority >= lowest.priority:
+                continue
+
             currentUtil = self._getGpuUtil(snapshot, gpuIndex)
             for runningJob in self.queueManager.getRunningJobsOnGpu(gpuIndex):
                 if not runningJob.preemptible:
@@ -391,10 +649,10 @@ class SchedulerCore:
             )
             victim = rankedVictims[0]
             targetGpus = self._getJobAssignedGpus(victim)
-            print(
-                f"[{time.strftime('%H:%M:%S')}] "
-                f"Scored preemption victim {victim.id} "
-                f"for higher priority job {candidate.id}"
+            logger.info(
+                "Scored preemption victim %s for higher priority job %s",
+                victim.id,
+                candidate.id,
             )
             self._preemptJobs(
                 victims=[victim],
@@ -412,9 +670,12 @@ class SchedulerCore:
 
     def _handleScheduling(self) -> bool:
         snapshot = self.monitor.getLastStats()
+        nowWall = time.time()
+        nowMono = time.monotonic()
         fairnessPenalty = self._buildUserFairnessPenalty()
         queuedJobs = self.queueManager.getQueuedJobs(
             agingFactor=self.agingFactor,
+            now=nowWall,
             includePaused=True,
             fairnessPenaltyByUser=fairnessPenalty,
         )
@@ -423,6 +684,13 @@ class SchedulerCore:
 
         runningCountsByUser = self._getRunningUserCounts()
 
+        # Greedy backfill: walk the whole priority-ordered list and start
+        # every candidate that still fits, instead of stopping after the
+        # first placement. A large job that cannot fit is simply skipped,
+        # so smaller jobs behind it backfill the remaining GPUs in the
+        # same cycle. Free-GPU state and fair-share counts are updated as
+        # assignments land, so later candidates see the shrunken capacity.
+        scheduledAny = False
         for candidate in queuedJobs:
             if not self._canRunUnderFairShare(candidate, runningCountsByUser):
                 continue
@@ -431,6 +699,7 @@ class SchedulerCore:
                 candidate,
                 snapshot,
                 enforcePolicy=False,
+                now=nowMono,
             )
             if not allocatedGpus:
                 continue
@@ -440,6 +709,7 @@ class SchedulerCore:
                 allocatedGpus,
                 snapshot,
                 enforcePolicy=True,
+                now=nowMono,
             ):
                 continue
 
@@ -524,59 +794,89 @@ class SchedulerCore:
                     checkpointHash=checkpointHash,
                 )
 
-            print(
-                f"[{time.strftime('%H:%M:%S')}] "
-                f"{'Resumed' if resumedThisCycle else 'Started'} job {job.id} "
-                f"on GPU {allocatedGpus}"
+            logger.info(
+                "%s job %s on GPU %s",
+                "Resumed" if resumedThisCycle else "Started",
+                job.id,
+                allocatedGpus,
             )
 
-            return True
+            scheduledAny = True
+            user = self._getJobUser(job)
+            runningCountsByUser[user] = runningCountsByUser.get(user, 0) + 1
 
-        return False
+        if scheduledAny:
+            self.stateChanged.set()
+        return scheduledAny
 
     # ----------------------------------------------------
     # Helpers
     # ----------------------------------------------------
 
+    @staticmethod
+    def _buildGpuView(snapshot) -> GpuView:
+        backend = snapshot.get("backend")
+        utilByGpu: Dict[int, float] = {}
+        memUtilByGpu: Dict[int, Optional[float]] = {}
+        freeMemByGpu: Dict[int, Optional[float]] = {}
+
+        for g in snapshot.get("gpus", ()):
+            idx = g.get("index")
+            utilByGpu[idx] = g.get("gpuUtilPercent", 0.0)
+
+            memUtil = g.get("gpuMemUtilPercent")
+            memUtilByGpu[idx] = None if memUtil is None else float(memUtil)
+
+            memUsedMb = g.get("gpuMemUsedMb")
+            memTotalMb = g.get("gpuMemTotalMb")
+            freeMemMb: Optional[float] = None
+            if memUsedMb is not None and memTotalMb is not None:
+                try:
+                    freeMemMb = max(0.0, float(memTotalMb) - float(memUsedMb))
+                except (TypeError, ValueError):
+                    freeMemMb = None
+            freeMemByGpu[idx] = freeMemMb
+
+        return GpuView(
+            snapshot=snapshot,
+            backend=backend,
+            utilByGpu=utilByGpu,
+            memUtilByGpu=memUtilByGpu,
+            freeMemByGpu=freeMemByGpu,
+        )
+
+    def _describeSnapshot(self, snapshot) -> GpuView:
+        # Snapshots are published immutably by the monitor, so identity is
+        # a safe cache key; the view holds a reference to the snapshot it
+        # indexed, keeping that identity stable for its lifetime.
+        view = self._gpuView
+        if view is not None and view.snapshot is snapshot:
+            return view
+
+        view = self._buildGpuView(snapshot)
+        self._gpuView = view
+        return view
+
     def _getGpuUtil(self, snapshot, gpuIndex: int) -> float:
-        if snapshot.get("backend") == "nvidia-smi":
-            for g in snapshot.get("gpus", []):
-                if g.get("index") == gpuIndex:
-                    return g.get("gpuUtilPercent", 0.0)
+        view = self._describeSnapshot(snapshot)
+        if view.backend == "nvidia-smi":
+            return view.utilByGpu.get(gpuIndex, 0.0)
 
-        if snapshot.get("backend") == "powermetrics":
+        if view.backend == "powermetrics":
             return snapshot.get("gpuUtilPercent", 0.0)
 
         return 0.0
 
     def _getGpuMemUtil(self, snapshot, gpuIndex: int) -> Optional[float]:
-        if snapshot.get("backend") == "nvidia-smi":
-            for g in snapshot.get("gpus", []):
-                if g.get("index") == gpuIndex:
-                    memUtil = g.get("gpuMemUtilPercent")
-                    if memUtil is None:
-                        return None
-                    return float(memUtil)
+        view = self._describeSnapshot(snapshot)
+        if view.backend == "nvidia-smi":
+            return view.memUtilByGpu.get(gpuIndex)
         return None
 
     def _getGpuFreeMemMb(self, snapshot, gpuIndex: int) -> Optional[float]:
-        if snapshot.get("backend") == "nvidia-smi":
-            for g in snapshot.get("gpus", []):
-                if g.get("index") != gpuIndex:
-                    continue
-
-                memUsedMb = g.get("gpuMemUsedMb")
-                memTotalMb = g.get("gpuMemTotalMb")
-                if memUsedMb is None or memTotalMb is None:
-                    return None
-
-                try:
-                    freeMemMb = float(memTotalMb) - float(memUsedMb)
-                except (TypeError, ValueError):
-                    return None
-
-                return max(0.0, freeMemMb)
-
+        view = self._describeSnapshot(snapshot)
+        if view.backend == "nvidia-smi":
+            return view.freeMemByGpu.get(gpuIndex)
         return None
 
     def _placementScore(
@@ -591,7 +891,7 @@ class SchedulerCore:
         utilCost = utilCost / max(1, len(gpuSet))
 
         leftovers: List[float] = []
-        if snapshot and snapshot.get("backend") == "nvidia-smi":
+        if snapshot and self._describeSnapshot(snapshot).backend == "nvidia-smi":
             required = float(job.requiredMemMb or 0.0)
             for gpuIndex in gpuSet:
                 freeMem = self._getGpuFreeMemMb(snapshot, gpuIndex)
@@ -634,6 +934,7 @@ class SchedulerCore:
         allocatedGpus: List[int],
         snapshot,
         enforcePolicy: bool,
+        now: Optional[float] = None,
     ) -> bool:
         if job.requiredMemMb is not None and snapshot is None:
             if not (job.status == JobStatus.PAUSED and job.pid is not None):
@@ -648,6 +949,7 @@ class SchedulerCore:
                     gpuIndex,
                     util,
                     currentMemUtil=memUtil,
+                    now=now,
                 ):
                     return False
 
@@ -663,6 +965,7 @@ class SchedulerCore:
         job: Job,
         snapshot,
         enforcePolicy: bool,
+        now: Optional[float] = None,
     ) -> Optional[List[int]]:
         freeGpus = self.queueManager.getFreeGpus(self.gpuIndices)
         if job.requiredGpus > len(freeGpus):
@@ -678,6 +981,7 @@ class SchedulerCore:
                         preferred,
                         snapshot,
                         enforcePolicy=enforcePolicy,
+                        now=now,
                     ):
                         return list(preferred)
             return None
@@ -700,6 +1004,7 @@ class SchedulerCore:
                 gpuSet,
                 snapshot,
                 enforcePolicy=enforcePolicy,
+                now=now,
             ):
                 feasible.append(
                     (
@@ -976,6 +1281,8 @@ class SchedulerCore:
                 },
             )
 
+        self.stateChanged.set()
+
     def _isAcpEnabled(self, job: Job) -> bool:
         if job.meta.get("acprEnabled") is True:
             return True
@@ -1008,7 +1315,7 @@ class SchedulerCore:
                 extra=extra,
             )
         except Exception as e:
-            print(f"Proof append failed for job {job.id}: {e}")
+            logger.error("Proof append failed for job %s: %s", job.id, e)
 
     def _requestCheckpoint(self, job: Job) -> Optional[str]:
         if job.pid is None:
@@ -1071,6 +1378,48 @@ class SchedulerCore:
     # Job cancellations
     # ----------------------------------------------------
 
+    def _cancelJobNoLock(self, jobId: str) -> bool:
+        # 1️⃣ Check queued jobs
+        for job in self.queueManager.getQueuedJobs():
+            if job.id == jobId:
+                if job.pid is not None:
+                    runner.terminateJob(job.pid)
+                JobStateMachine.cancel(job)
+                self.queueManager.removeJob(jobId)
+                self._appendProofEvent(
+                    job,
+                    eventType="cancel",
+                    gpuIndex=self._getPrimaryAssignedGpu(job),
+                    attestation=job.lastAttestation,
+                    extra={"state": "queued"},
+                )
+                self._recordTerminalJob(job)
+                logger.info("Cancelled queued job %s", jobId)
+                return True
+
+        # 2️⃣ Check running jobs
+        for job in self.queueManager.getRunningJobs():
+            if job.id == jobId:
+                gpuIndex = self._getPrimaryAssignedGpu(job)
+                if job.pid:
+                    runner.terminateJob(job.pid)
+
+                JobStateMachine.cancel(job)
+                self.queueManager.releaseJob(job)
+                self._appendProofEvent(
+                    job,
+                    eventType="cancel",
+                    gpuIndex=gpuIndex,
+                    attestation=job.lastAttestation,
+                    extra={"state": "running"},
+                )
+                self._recordTerminalJob(job)
+
+                logger.info("Cancelled running job %s", jobId)
+                return True
+
+        return False
+
     def cancelJob(self, jobId: str) -> bool:
         """
         Cancel a job by ID.
@@ -1078,46 +1427,32 @@ class SchedulerCore:
         """
 
         with self._condition:
+            cancelled = self._cancelJobNoLock(jobId)
+            if cancelled:
+                self._condition.notify()
 
-            # 1️⃣ Check queued jobs
-            for job in self.queueManager.getQueuedJobs():
-                if job.id == jobId:
-                    if job.pid is not None:
-                        runner.terminateJob(job.pid)
-                    JobStateMachine.cancel(job)
-                    self.queueManager.removeJob(jobId)
-                    self._appendProofEvent(
-                        job,
-                        eventType="cancel",
-                        gpuIndex=self._getPrimaryAssignedGpu(job),
-                        attestation=job.lastAttestation,
-                        extra={"state": "queued"},
-                    )
-                    self._recordTerminalJob(job)
-                    print(f"Cancelled queued job {jobId}")
-                    self._condition.notify()
-                    return True
-
-            # 2️⃣ Check running jobs
-            for job in self.queueManager.getRunningJobs():
-                if job.id == jobId:
-                    gpuIndex = self._getPrimaryAssignedGpu(job)
-                    if job.pid:
-                        runner.terminateJob(job.pid)
-
-                    JobStateMachine.cancel(job)
-                    self.queueManager.releaseJob(job)
-                    self._appendProofEvent(
-                        job,
-                        eventType="cancel",
-                        gpuIndex=gpuIndex,
-                        attestation=job.lastAttestation,
-                        extra={"state": "running"},
-                    )
-                    self._recordTerminalJob(job)
+        if cancelled:
+            self._signalWake()
+            self.stateChanged.set()
+        return cancelled
 
-                    print(f"Cancelled running job {jobId}")
-                    self._condition.notify()
-                    return True
+    def cancelJobs(self, jobIds: List[str]) -> int:
+        """
+        Cancel a batch of jobs under one condition acquisition and one
+        wake; returns how many were found and cancelled.
+        """
 
-        return False
+        if not jobIds:
+            return 0
+
+        with self._condition:
+            cancelledCount = sum(
+                1 for jobId in jobIds if self._cancelJobNoLock(jobId)
+            )
+            if cancelledCount:
+                self._condition.notify()
+
+        if cancelledCount:
+            self._signalWake()
+            self.stateChanged.set()
+        return cancelledCount
@@ -14,7 +14,36 @@ Supports:
 from __future__ import annotations
 
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Optional
+
+
+@lru_cache(maxsize=4096)
+def _decideSchedulable(
+    utilKey: float,
+    memKey: Optional[float],
+    avgKey: Optional[float],
+    utilThreshold: float,
+    memThreshold: float,
+) -> bool:
+    """
+    Pure threshold decision, memoized. Callers with integral thresholds
+    pass truncated-int keys (floor(x) < t is exactly x < t for integer
+    t), so in steady state — utilization oscillating in a narrow band —
+    nearly every call is a cache hit.
+    """
+    # Adaptive rule
+    if avgKey is not None and avgKey < utilThreshold:
+        if memKey is None or memKey < memThreshold:
+            return True
+
+    # Fallback static
+    if utilKey < utilThreshold:
+        if memKey is None or memKey < memThreshold:
+            return True
+
+    return False
 
 
 class SchedulerPolicy:
@@ -31,8 +60,18 @@ class SchedulerPolicy:
         self.historyWindow = historyWindow
         self.spikeDelta = spikeDelta
         self.cooldownSeconds = cooldownSeconds
-
-        self._utilHistory: Dict[int, List[float]] = {}
+        # Bucketing to whole percent is decision-preserving only when the
+        # thresholds themselves are integral; otherwise raw floats are
+        # used as cache keys (lower hit rate, identical results).
+        self._bucketMetrics = (
+            float(staticUtilThreshold).is_integer()
+            and float(staticMemThreshold).is_integer()
+        )
+
+        # Bounded deques evict the oldest sample at O(1) on append; the
+        # running sum keeps the moving average O(1) regardless of window.
+        self._utilHistory: Dict[int, Deque[float]] = {}
+        self._utilSum: Dict[int, float] = {}
         self._cooldownUntil: Dict[int, float] = {}
 
     # ----------------------------------------------------
@@ -40,17 +79,25 @@ class SchedulerPolicy:
     # ----------------------------------------------------
 
     def updateMetrics(self, gpuIndex: int, utilPercent: float) -> None:
-        hist = self._utilHistory.setdefault(gpuIndex, [])
-        hist.append(utilPercent)
+        hist = self._utilHistory.get(gpuIndex)
+        if hist is None:
+            hist = self._utilHistory[gpuIndex] = deque(
+                maxlen=self.historyWindow
+            )
+            self._utilSum[gpuIndex] = 0.0
 
-        if len(hist) > self.historyWindow:
-            hist.pop(0)
+        if len(hist) == self.historyWindow:
+            # Full window: the append below evicts the oldest sample.
+            self._utilSum[gpuIndex] -= hist[0]
+
+        hist.append(utilPercent)
+        self._utilSum[gpuIndex] += utilPercent
 
     def _movingAverage(self, gpuIndex: int) -> Optional[float]:
         hist = self._utilHistory.get(gpuIndex)
         if not hist:
             return None
-        return sum(hist) / len(hist)
+        return self._utilSum[gpuIndex] / len(hist)
 
     # ----------------------------------------------------
     # Spike Detection
@@ -67,14 +114,16 @@ class SchedulerPolicy:
     # Cooldown Management
     # ----------------------------------------------------
 
-    def _isCoolingDown(self, gpuIndex: int) -> bool:
+    def _isCoolingDown(self, gpuIndex: int, now: Optional[float] = None) -> bool:
         until = self._cooldownUntil.get(gpuIndex)
         if not until:
             return False
-        return time.time() < until
+        nowTs = time.monotonic() if now is None else now
+        return nowTs < until
 
-    def _triggerCooldown(self, gpuIndex: int) -> None:
-        self._cooldownUntil[gpuIndex] = time.time() + self.cooldownSeconds
+    def _triggerCooldown(self, gpuIndex: int, now: Optional[float] = None) -> None:
+        nowTs = time.monotonic() if now is None else now
+        self._cooldownUntil[gpuIndex] = nowTs + self.cooldownSeconds
 
     # ----------------------------------------------------
     # Decision Logic
@@ -85,6 +134,7 @@ class SchedulerPolicy:
         gpuIndex: int,
         currentUtil: float,
         currentMemUtil: Optional[float] = None,
+        now: Optional[float] = None,
     ) -> bool:
         """
         Hybrid decision:
@@ -92,34 +142,41 @@ class SchedulerPolicy:
         2. If spike detected → cooldown + reject
         3. Adaptive average check
         4. Fallback to static threshold
+
+        `now` is a time.monotonic() reading; callers iterating many GPUs
+        should take one reading per pass instead of one per call.
+        Cooldown deadlines are monotonic, so wall-clock adjustments can
+        no longer expire (or extend) them.
         """
 
         self.updateMetrics(gpuIndex, currentUtil)
 
-        if self._isCoolingDown(gpuIndex):
+        if now is None:
+            now = time.monotonic()
+
+        if self._isCoolingDown(gpuIndex, now):
             return False
 
         if self._detectSpike(gpuIndex):
-            self._triggerCooldown(gpuIndex)
+            self._triggerCooldown(gpuIndex, now)
             return False
 
         avg = self._movingAverage(gpuIndex)
 
-        # Adaptive rule
-        if avg is not None and avg < self.staticUtilThreshold:
-            if currentMemUtil is None:
-                return True
-            if currentMemUtil < self.staticMemThreshold:
-                return True
-
-        # Fallback static
-        if currentUtil < self.staticUtilThreshold:
-            if currentMemUtil is None:
-                return True
-            if currentMemUtil < self.staticMemThreshold:
-                return True
-
-        return False
+        if self._bucketMetrics:
+            utilKey: float = int(currentUtil)
+            memKey = None if currentMemUtil is None else int(currentMemUtil)
+            avgKey = None if avg is None else int(avg)
+        else:
+            utilKey, memKey, avgKey = currentUtil, currentMemUtil, avg
+
+        return _decideSchedulable(
+            utilKey,
+            memKey,
+            avgKey,
+            self.staticUtilThreshold,
+            self.staticMemThreshold,
+        )
 
     # ----------------------------------------------------
     # Preemption Decision
@@ -15,16 +15,43 @@ from __future__ import annotations
 import heapq
 import threading
 import time
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from gpuscheduler.daemon.job import Job, JobStatus
 
 
 class QueueManager:
     def __init__(self, agingFactor: float = 0.0):
-        self._heap: List[Tuple[int, float, str]] = []
+        # Lazy-deletion heap: entries are never scrubbed on remove/assign.
+        # Each entry carries a generation number; an entry is live only if
+        # its generation matches _entryGen for that job id. Stale entries
+        # are skipped on read and compacted away once they outnumber the
+        # live ones, so remove/assign stay O(log N) amortized instead of
+        # rebuilding the whole heap.
+        self._heap: List[Tuple[int, float, str, int]] = []
+        self._entryGen: Dict[str, int] = {}
+        self._genCounter = 0
+        self._staleCount = 0
         self._jobMap: Dict[str, Job] = {}
         self._runningByGpu: Dict[int, List[Job]] = {}
+        # Reverse index maintained on assignment so release only touches
+        # the GPUs a job actually holds instead of scanning all of them.
+        self._jobToGpus: Dict[str, List[int]] = {}
+        # Per-GPU heap of (-priority, createdAt, id): heap top is the
+        # lowest-priority occupant. Entries go stale on release and are
+        # lazily skipped, mirroring the queued-jobs tombstone scheme.
+        self._runningHeapByGpu: Dict[int, List[Tuple[float, float, str]]] = {}
+        # Immutable snapshot of _runningByGpu republished on every
+        # assignment/release. Readers deref the current reference without
+        # taking the lock — reference assignment is atomic — so hot read
+        # paths never contend with submit/cancel from other threads.
+        self._runningView: Mapping[int, Tuple[Job, ...]] = MappingProxyType({})
+        # Count of exclusive occupants per GPU, maintained on assignment
+        # and release (capturing exclusivity at assignment time), so the
+        # free-GPU test is a counter read instead of an all() scan over
+        # every occupant.
+        self._exclusiveCount: Dict[int, int] = {}
         self.defaultAgingFactor = max(0.0, float(agingFactor))
         self._lock = threading.RLock()
 
@@ -35,14 +62,11 @@ class QueueManager:
     def addJob(self, job: Job) -> None:
         with self._lock:
             self._jobMap[job.id] = job
-            heapq.heappush(
-                self._heap,
-                (job.priority, job.createdAt, job.id),
-            )
+            self._pushEntryNoLock(job)
 
     def removeJob(self, jobId: str) -> None:
         with self._lock:
-            self._heap = [item for item in self._heap if item[2] != jobId]
+            self._invalidateEntryNoLock(jobId)
             self._jobMap.pop(jobId, None)
 
     # ----------------------------------------------------
@@ -53,6 +77,7 @@ class QueueManager:
         self,
         allGpuIndices: List[int],
         agingFactor: Optional[float] = None,
+        gpuFreeMemMb: Optional[Dict[int, float]] = None,
     ) -> Optional[Tuple[Job, List[int]]]:
         with self._lock:
             if not self._heap:
@@ -67,10 +92,23 @@ class QueueManager:
                 includePaused=True,
             )
             for job in queuedJobs:
-                if job.requiredGpus > len(freeGpus):
+                # "Free" by occupancy alone is not enough: when the caller
+                # supplies live per-GPU free VRAM, drop GPUs whose memory
+                # is already saturated (e.g. by an external process) below
+                # the job's declared requirement.
+                candidateGpus = freeGpus
+                if gpuFreeMemMb is not None and job.requiredMemMb is not None:
+                    requiredMemMb = float(job.requiredMemMb)
+                    candidateGpus = [
+                        gpu
+                        for gpu in freeGpus
+                        if float(gpuFreeMemMb.get(gpu, 0.0)) >= requiredMemMb
+                    ]
+
+                if job.requiredGpus > len(candidateGpus):
                     continue
 
-                allocated = list(freeGpus[: job.requiredGpus])
+                allocated = list(candidateGpus[: job.requiredGpus])
                 self._assignJobNoLock(job, allocated)
                 return job, allocated
 
@@ -97,11 +135,24 @@ class QueueManager:
 
     def releaseJob(self, job: Job) -> None:
         with self._lock:
-            for gpu, jobs in list(self._runningByGpu.items()):
-                if job in jobs:
-                    jobs.remove(job)
+            for gpu in self._jobToGpus.pop(job.id, ()):
+                jobs = self._runningByGpu.get(gpu)
+                if not jobs:
+                    continue
+                # Filter by id: avoids the dataclass field-by-field __eq__
+                # that `job in jobs` / list.remove would run per element.
+                removed = len(jobs)
+                jobs[:] = [j for j in jobs if j.id != job.id]
+                removed -= len(jobs)
+                if removed and job.exclusive:
+                    count = self._exclusiveCount.get(gpu, 0) - removed
+                    if count > 0:
+                        self._exclusiveCount[gpu] = count
+                    else:
+                        self._exclusiveCount.pop(gpu, None)
                 if not jobs:
                     self._runningByGpu.pop(gpu, None)
+            self._publishRunningViewNoLock()
 
     def requeueJob(
         self,
@@ -124,26 +175,46 @@ class QueueManager:
             if refreshTimestamp:
                 job.createdAt = time.time()
 
-            heapq.heappush(
-                self._heap,
-                (job.priority, job.createdAt, job.id),
-            )
+            self._pushEntryNoLock(job)
 
     # ----------------------------------------------------
     # Introspection
     # ----------------------------------------------------
 
     def getRunningJobs(self) -> List[Job]:
+        # _jobToGpus already holds exactly one key per distinct running
+        # job, so no per-GPU scan-and-dedupe is needed.
         with self._lock:
-            seen: Dict[str, Job] = {}
-            for jobs in self._runningByGpu.values():
-                for job in jobs:
-                    seen[job.id] = job
-            return list(seen.values())
+            jobMap = self._jobMap
+            return [
+                jobMap[jobId]
+                for jobId in self._jobToGpus
+                if jobId in jobMap
+            ]
 
     def getRunningJobsOnGpu(self, gpuIndex: int) -> List[Job]:
+        # Lock-free: reads the latest published immutable view.
+        return list(self._runningView.get(gpuIndex, ()))
+
+    def peekLowestPriorityRunning(self, gpuIndex: int) -> Optional[Job]:
+        """Lowest-priority job currently holding gpuIndex, or None."""
         with self._lock:
-            return list(self._runningByGpu.get(gpuIndex, []))
+            heap = self._runningHeapByGpu.get(gpuIndex)
+            if not heap:
+                return None
+
+            while heap:
+                _, _, jobId = heap[0]
+                job = self._jobMap.get(jobId)
+                heldGpus = self._jobToGpus.get(jobId)
+                if job is None or not heldGpus or gpuIndex not in heldGpus:
+                    # Released since it was pushed; drop the stale entry.
+                    heapq.heappop(heap)
+                    continue
+                return job
+
+            self._runningHeapByGpu.pop(gpuIndex, None)
+            return None
 
     def getRunningCountByUser(self) -> Dict[str, int]:
         with self._lock:
@@ -157,13 +228,41 @@ class QueueManager:
         self,
         agingFactor: Optional[float] = None,
     ) -> Optional[Job]:
-        jobs = self.getQueuedJobs(
-            agingFactor=agingFactor,
-            includePaused=True,
-        )
-        if not jobs:
-            return None
-        return jobs[0]
+        # Single min-scan instead of materializing and sorting the whole
+        # queued list just to read its head. Aging is applied lazily at
+        # comparison time, so no heap rebuild is needed either.
+        with self._lock:
+            nowTs = time.time()
+            effectiveAging = (
+                self.defaultAgingFactor
+                if agingFactor is None
+                else max(0.0, float(agingFactor))
+            )
+
+            best: Optional[Job] = None
+            bestKey: Optional[Tuple[float, float, str]] = None
+            entryGen = self._entryGen
+            for _, _, jobId, gen in self._heap:
+                if entryGen.get(jobId) != gen:
+                    continue
+
+                job = self._jobMap.get(jobId)
+                if job is None:
+                    continue
+                if job.status not in {JobStatus.QUEUED, JobStatus.PAUSED}:
+                    continue
+
+                effectivePriority = self.getEffectivePriority(
+                    job,
+                    agingFactor=effectiveAging,
+                    now=nowTs,
+                )
+                key = (effectivePriority, float(job.createdAt), job.id)
+                if bestKey is None or key < bestKey:
+                    best = job
+                    bestKey = key
+
+            return best
 
     def getQueuedJobs(
         self,
@@ -181,11 +280,11 @@ class QueueManager:
             )
 
             rows: List[Tuple[float, float, str, Job]] = []
-            seenIds = set()
-            for _, _, jobId in self._heap:
-                if jobId in seenIds:
+            entryGen = self._entryGen
+            for _, _, jobId, gen in self._heap:
+                # Stale entry (job removed, assigned, or re-pushed since).
+                if entryGen.get(jobId) != gen:
                     continue
-                seenIds.add(jobId)
 
                 job = self._jobMap.get(jobId)
                 if job is None:
@@ -256,24 +355,68 @@ class QueueManager:
         job: Job,
         allocatedGpus: List[int],
     ) -> None:
+        heldGpus = self._jobToGpus.setdefault(job.id, [])
         for gpu in allocatedGpus:
             self._runningByGpu.setdefault(gpu, []).append(job)
+            if gpu not in heldGpus:
+                heldGpus.append(gpu)
+            if job.exclusive:
+                self._exclusiveCount[gpu] = (
+                    self._exclusiveCount.get(gpu, 0) + 1
+                )
+            heapq.heappush(
+                self._runningHeapByGpu.setdefault(gpu, []),
+                (-float(job.priority), float(job.createdAt), job.id),
+            )
+
+        self._publishRunningViewNoLock()
+        self._invalidateEntryNoLock(job.id)
+
+    def _publishRunningViewNoLock(self) -> None:
+        self._runningView = MappingProxyType(
+            {gpu: tuple(jobs) for gpu, jobs in self._runningByGpu.items()}
+        )
+
+    def _pushEntryNoLock(self, job: Job) -> None:
+        self._genCounter += 1
+        gen = self._genCounter
+        if job.id in self._entryGen:
+            # A previous entry for this id is still in the heap; it becomes
+            # stale the moment the generation advances.
+            self._staleCount += 1
+        self._entryGen[job.id] = gen
+        heapq.heappush(
+            self._heap,
+            (job.priority, job.createdAt, job.id, gen),
+        )
 
-        self._heap = [item for item in self._heap if item[2] != job.id]
+    def _invalidateEntryNoLock(self, jobId: str) -> None:
+        if self._entryGen.pop(jobId, None) is not None:
+            self._staleCount += 1
+        self._compactIfNeededNoLock()
+
+    def _compactIfNeededNoLock(self) -> None:
+        # One-shot rebuild once stale entries dominate; keeps the heap from
+        # growing without bound under heavy cancel/assign churn.
+        if self._staleCount * 2 <= len(self._heap):
+            return
+
+        entryGen = self._entryGen
+        self._heap = [
+            entry for entry in self._heap if entryGen.get(entry[2]) == entry[3]
+        ]
         heapq.heapify(self._heap)
+        self._staleCount = 0
 
     def _getFreeGpus(self, allGpuIndices: List[int]) -> List[int]:
-        free = []
-        for gpu in allGpuIndices:
-            runningJobs = self._runningByGpu.get(gpu, [])
-            if not runningJobs:
-                free.append(gpu)
-                continue
-
-            # Shared allowed only if all running jobs are non-exclusive.
-            if all(not job.exclusive for job in runningJobs):
-                free.append(gpu)
-        return free
+        # Shared allowed only if no exclusive occupant: a counter read
+        # per GPU instead of scanning every running job on it.
+        exclusiveCount = self._exclusiveCount
+        return [
+            gpu
+            for gpu in allGpuIndices
+            if exclusiveCount.get(gpu, 0) == 0
+        ]
 
     def _extractJobUser(self, job: Job) -> str:
         user = job.meta.get("user")
@@ -10,36 +10,42 @@ Prevents illegal status mutations.
 from __future__ import annotations
 
 import time
-from typing import Set
 
 from gpuscheduler.daemon.job import Job, JobStatus
 
 
+# Shared singletons so no set is allocated per transition.
+_EMPTY: frozenset = frozenset()
+_TERMINAL = frozenset(
+    {JobStatus.FINISHED, JobStatus.FAILED, JobStatus.CANCELLED}
+)
+
+
 class JobStateMachine:
 
     # Allowed transitions map
     _allowedTransitions = {
-        JobStatus.QUEUED: {
+        JobStatus.QUEUED: frozenset({
             JobStatus.RUNNING,
             JobStatus.CANCELLED,
-        },
+        }),
 
-        JobStatus.RUNNING: {
+        JobStatus.RUNNING: frozenset({
             JobStatus.PAUSED,
             JobStatus.FINISHED,
             JobStatus.FAILED,
             JobStatus.CANCELLED,
             JobStatus.QUEUED,  # ← allow requeue after preemption
-        },
+        }),
 
-        JobStatus.PAUSED: {
+        JobStatus.PAUSED: frozenset({
             JobStatus.RUNNING,
             JobStatus.CANCELLED,
-        },
+        }),
 
-        JobStatus.FINISHED: set(),
-        JobStatus.FAILED: set(),
-        JobStatus.CANCELLED: set(),
+        JobStatus.FINISHED: _EMPTY,
+        JobStatus.FAILED: _EMPTY,
+        JobStatus.CANCELLED: _EMPTY,
     }
 
     # ----------------------------------------------------
@@ -50,7 +56,7 @@ class JobStateMachine:
     def transition(cls, job: Job, newStatus: JobStatus) -> None:
         current = job.status
 
-        if newStatus not in cls._allowedTransitions.get(current, set()):
+        if newStatus not in cls._allowedTransitions.get(current, _EMPTY):
             raise ValueError(
                 f"Illegal transition from {current.value} to {newStatus.value}"
             )
@@ -64,7 +70,7 @@ class JobStateMachine:
         if newStatus == JobStatus.RUNNING:
             job.startedAt = now
 
-        if newStatus in {JobStatus.FINISHED, JobStatus.FAILED, JobStatus.CANCELLED}:
+        if newStatus in _TERMINAL:
             job.finishedAt = now
             job.pid = None
             job.assignedGpu = None
@@ -13,13 +13,61 @@ Features:
 from __future__ import annotations
 
 import argparse
+import atexit
 import json
+import logging
+import logging.handlers
 import os
+import queue
 import signal
+import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    # Optional fast JSON codec for control/inbox files.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional MessagePack codec for the machine-read snapshot mirror.
+    import msgspec.msgpack
+
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+except ImportError:
+    msgspec = None
+    _MSGPACK_ENCODER = None
+
+try:
+    # Optional event-driven inbox/control pickup; the 1 Hz sleep remains
+    # the fallback poll interval when inotify is unavailable.
+    from inotify_simple import INotify, flags as _inotifyFlags
+except ImportError:
+    INotify = None
+    _inotifyFlags = None
+
+# Codec entry points bound once for the daemon lifetime; call sites use
+# these instead of re-testing the optional import per file.
+_loadsJsonBytes = orjson.loads if orjson is not None else json.loads
+_dumpsJsonBytes = (
+    orjson.dumps
+    if orjson is not None
+    else lambda obj: json.dumps(obj).encode("utf-8")
+)
+
+
+def encodeJobBytes(job: Job) -> bytes:
+    """Wire encoding of a job for inbox handoff; inverse of decodeJobBytes."""
+    return _dumpsJsonBytes(job.toDict())
+
+
+def decodeJobBytes(raw: bytes) -> Job:
+    """Rebuild a job from its inbox wire encoding."""
+    return Job.fromDict(_loadsJsonBytes(raw))
 
 from gpuscheduler.daemon import runner
 from gpuscheduler.daemon.job import Job, JobStatus
@@ -27,12 +75,59 @@ from gpuscheduler.scheduler.core import SchedulerCore
 from gpuscheduler.storage.sqliteStore import SQLiteJobStore
 
 
+# Same queue-backed logging as the scheduler core: the serve loop only
+# enqueues records; formatting and the stdout write happen on the
+# QueueListener thread, off the inbox/control hot path.
+logger = logging.getLogger("gpuscheduler.serve")
+if not logger.handlers:
+    _logQueue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _streamHandler = logging.StreamHandler(sys.stdout)
+    _streamHandler.setFormatter(
+        logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
+    )
+    _logListener = logging.handlers.QueueListener(_logQueue, _streamHandler)
+    _logListener.start()
+    # Drain the queue at interpreter exit so the shutdown lines (logged
+    # from main's finally block) actually reach stdout/daemon.log.
+    atexit.register(_logListener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(_logQueue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
 INBOX_DIR = Path("inbox")
 STATE_DIR = Path("state")
 CONTROL_DIR = Path("control")
 DEFAULT_DB_PATH = Path("state/jobs.db")
 DEFAULT_PID_FILE = Path("state/daemon.pid")
 
+# Snapshot paths joined once; the hot loop reuses them every iteration.
+SNAPSHOT_PATH = STATE_DIR / "snapshot.json"
+SNAPSHOT_TMP_PATH = STATE_DIR / "snapshot.json.tmp"
+SNAPSHOT_MP_PATH = STATE_DIR / "snapshot.mp"
+SNAPSHOT_MP_TMP_PATH = STATE_DIR / "snapshot.mp.tmp"
+
+
+def _resolveDataDirs() -> None:
+    """
+    Rebind the data-dir globals to absolute paths once at daemon start.
+    Every per-tick open/scandir/unlink then short-circuits the kernel's
+    cwd resolution instead of walking from AT_FDCWD each time. Done here
+    rather than at import so the CLI (which shares these constants as
+    cwd-relative defaults) is unaffected.
+    """
+    global INBOX_DIR, STATE_DIR, CONTROL_DIR
+    global SNAPSHOT_PATH, SNAPSHOT_TMP_PATH
+    global SNAPSHOT_MP_PATH, SNAPSHOT_MP_TMP_PATH
+
+    INBOX_DIR = INBOX_DIR.resolve()
+    STATE_DIR = STATE_DIR.resolve()
+    CONTROL_DIR = CONTROL_DIR.resolve()
+    SNAPSHOT_PATH = STATE_DIR / "snapshot.json"
+    SNAPSHOT_TMP_PATH = STATE_DIR / "snapshot.json.tmp"
+    SNAPSHOT_MP_PATH = STATE_DIR / "snapshot.mp"
+    SNAPSHOT_MP_TMP_PATH = STATE_DIR / "snapshot.mp.tmp"
+
 
 def parseGpuIndices(arg: str) -> List[int]:
     rawParts = [p.strip() for p in str(arg).split(",")]
@@ -53,51 +148,295 @@ def parseGpuIndices(arg: str) -> List[int]:
     return indices
 
 
+# Read+parse pool for submission bursts. Disk reads and orjson decoding
+# both release the GIL, so a few workers overlap I/O with parse compute;
+# created lazily on the first burst large enough to benefit.
+_parsePool: Optional[ThreadPoolExecutor] = None
+_PARSE_POOL_THRESHOLD = 8
+
+
+def _getParsePool() -> ThreadPoolExecutor:
+    global _parsePool
+    if _parsePool is None:
+        _parsePool = ThreadPoolExecutor(
+            max_workers=4,
+            thread_name_prefix="gpusched-inbox",
+        )
+    return _parsePool
+
+
+def _parseInboxFile(path: str):
+    # Read, decode, and build the Job in one step so burst parsing hands
+    # back ready-to-submit objects; construction stays off the serve
+    # thread when the pool is in play.
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return path, decodeJobBytes(raw), None
+    except Exception as e:
+        return path, None, e
+
+
 def loadJobsFromInbox(core: SchedulerCore) -> None:
-    INBOX_DIR.mkdir(parents=True, exist_ok=True)
+    # Directories are created once in main(); re-running the mkdir here
+    # would cost a stat per poll for nothing.
+    # os.scandir reuses the d_type from the directory read instead of
+    # the extra stat per entry that pathlib.glob issues.
+    try:
+        it = os.scandir(INBOX_DIR)
+    except FileNotFoundError:
+        return
+    with it:
+        paths = [
+            entry.path
+            for entry in it
+            if entry.name.endswith(".json")
+            and entry.is_file(follow_symlinks=False)
+        ]
 
-    for file in INBOX_DIR.glob("*.json"):
-        try:
-            with file.open("r") as f:
-                data = json.load(f)
+    # Parse the whole burst first, then submit in one batch: the core
+    # takes its lock once for N jobs instead of once per file. Files are
+    # unlinked only after their job is in the queue; a file that fails to
+    # parse is left in place (and reported) without blocking the rest.
+    # Large bursts fan the read+decode out over the parse pool.
+    if len(paths) >= _PARSE_POOL_THRESHOLD:
+        parsed = list(_getParsePool().map(_parseInboxFile, paths))
+    else:
+        parsed = [_parseInboxFile(path) for path in paths]
+
+    jobs: List[Job] = []
+    jobPaths: List[str] = []
+    for path, job, error in parsed:
+        if error is not None:
+            logger.error("Failed to process %s: %s", path, error)
+            continue
 
-            job = Job.fromDict(data)
-            print(f"Loading job from inbox: {job.id}")
-            core.submitJob(job)
-            file.unlink()
+        logger.info("Loading job from inbox: %s", job.id)
+        jobs.append(job)
+        jobPaths.append(path)
 
-        except Exception as e:
-            print(f"Failed to process {file}: {e}")
+    if not jobs:
+        return
+
+    # Hand off through the core's SPSC inbox queue: no scheduler-lock
+    # traffic from this thread, one wake for the whole burst.
+    core.enqueueJobs(jobs)
+    for path in jobPaths:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.error("Failed to remove inbox file %s: %s", path, e)
 
 
 def handleControlCommands(core: SchedulerCore) -> None:
-    CONTROL_DIR.mkdir(parents=True, exist_ok=True)
+    # os.scandir + name filter avoids pathlib.glob's pattern matching and
+    # the extra stat per entry; the cancel_*.json naming contract is the
+    # entire filter criterion.
+    try:
+        it = os.scandir(CONTROL_DIR)
+    except FileNotFoundError:
+        return
+    with it:
+        paths = [
+            entry.path
+            for entry in it
+            if entry.name.startswith("cancel_")
+            and entry.name.endswith(".json")
+            and entry.is_file(follow_symlinks=False)
+        ]
 
-    for file in CONTROL_DIR.glob("cancel_*.json"):
+    # Collect every pending cancel first, then hand the batch to the core
+    # in one call — one lock acquisition for the whole burst. Files are
+    # removed once their command has been applied; unparseable files stay
+    # behind (and are reported) without blocking the rest.
+    jobIds: List[str] = []
+    donePaths: List[str] = []
+    for path in paths:
         try:
-            with file.open("r") as f:
-                data = json.load(f)
+            with open(path, "rb") as f:
+                raw = f.read()
+            data = _loadsJsonBytes(raw)
 
             jobId = data.get("jobId")
             if jobId:
-                core.cancelJob(jobId)
-
-            file.unlink()
+                jobIds.append(jobId)
+            donePaths.append(path)
         except Exception as e:
-            print(f"Control processing error: {e}")
+            logger.error("Control processing error: %s", e)
+
+    if jobIds:
+        core.cancelJobs(jobIds)
+
+    for path in donePaths:
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.error("Failed to remove control file %s: %s", path, e)
+
+
+def _replaceAtomically(tmp: Path, target: Path, payload: bytes) -> None:
+    """
+    Stage payload in tmp and rename(2) it over target: readers see the
+    old file or the new one, never a partial. A failed write leaves no
+    stale tmp file behind.
+    """
+    tmpPath = str(tmp)
+    try:
+        # Raw os.open/os.write skips the io stack; payload is already
+        # bytes, so no TextIOWrapper encoding pass is needed.
+        fd = os.open(
+            tmpPath,
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o644,
+        )
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
+        os.replace(tmpPath, str(target))
+    except OSError:
+        try:
+            os.unlink(tmpPath)
+        except OSError:
+            pass
+        raise
+
+
+# Change-detection key of the last snapshot written; when the scheduler
+# is idle (the common case) the 1 Hz rewrite is skipped entirely.
+_lastSnapshotKey = None
+
+# Per-job serialized dicts keyed by id: toDict (field copies plus dict
+# allocation per job) re-runs only when the job's observable state
+# changes, not on every snapshot rebuild.
+_jobDictCache: Dict[str, Tuple[tuple, dict]] = {}
+
+
+def _jobStateKey(job: Job) -> tuple:
+    return (
+        job.status.value,
+        job.pid,
+        job.priority,
+        job.startedAt,
+        job.finishedAt,
+        tuple(job.assignedGpus or ()),
+        job.proofStatus,
+    )
+
+
+def _jobDicts(jobs: List[Job]) -> List[dict]:
+    dicts: List[dict] = []
+    for job in jobs:
+        key = _jobStateKey(job)
+        cached = _jobDictCache.get(job.id)
+        if cached is not None and cached[0] == key:
+            dicts.append(cached[1])
+            continue
+        data = job.toDict()
+        _jobDictCache[job.id] = (key, data)
+        dicts.append(data)
+    return dicts
+
+
+def _snapshotKey(queued, running, terminal):
+    # proofStatus is included because attestation denial flips it while
+    # the job stays QUEUED with an unchanged pid; without it the rewrite
+    # would be skipped and status would report the stale value forever.
+    return (
+        tuple(
+            (job.id, job.status.value, job.pid, job.proofStatus)
+            for job in queued
+        ),
+        tuple(
+            (job.id, job.status.value, job.pid, job.proofStatus)
+            for job in running
+        ),
+        tuple((job.id, job.status.value) for job in terminal),
+    )
 
 
 def writeStateSnapshot(core: SchedulerCore) -> None:
-    STATE_DIR.mkdir(parents=True, exist_ok=True)
+    global _lastSnapshotKey
 
-    snapshot = {
-        "queued": [job.toDict() for job in core.queueManager.getQueuedJobs()],
-        "running": [job.toDict() for job in core.queueManager.getRunningJobs()],
-        "terminal": [job.toDict() for job in core.getTerminalJobs()],
-    }
+    queued = core.queueManager.getQueuedJobs()
+    running = core.queueManager.getRunningJobs()
+    terminal = core.getTerminalJobs()
 
-    with (STATE_DIR / "snapshot.json").open("w") as f:
-        json.dump(snapshot, f, indent=2)
+    key = _snapshotKey(queued, running, terminal)
+    if key == _lastSnapshotKey:
+        return
+
+    # Written once per second: compact output (no indent) halves the bytes,
+    # and orjson cuts the serializer CPU by an order of magnitude. With
+    # orjson and no msgpack mirror, the Job dataclasses go straight into
+    # the C serializer (field names match toDict, enums encode by value)
+    # and the per-job dict build is skipped entirely; otherwise the dicts
+    # are needed anyway and come from the per-job cache.
+    if orjson is not None and _MSGPACK_ENCODER is None:
+        payload = orjson.dumps(
+            {"queued": queued, "running": running, "terminal": terminal}
+        )
+    else:
+        snapshot = {
+            "queued": _jobDicts(queued),
+            "running": _jobDicts(running),
+            "terminal": _jobDicts(terminal),
+        }
+        payload = _dumpsJsonBytes(snapshot)
+
+        # Drop cache entries for jobs that no longer appear anywhere so
+        # the cache stays bounded by the live job set over the daemon's
+        # lifetime.
+        liveIds = {job.id for jobs in (queued, running, terminal) for job in jobs}
+        for jobId in list(_jobDictCache):
+            if jobId not in liveIds:
+                del _jobDictCache[jobId]
+
+    # Write-to-temp + os.replace keeps readers from ever seeing a torn
+    # snapshot: they get the old file or the new one, never a partial.
+    _replaceAtomically(SNAPSHOT_TMP_PATH, SNAPSHOT_PATH, payload)
+
+    # MessagePack mirror for machine readers (smaller payload, faster
+    # decode). snapshot.json stays authoritative so plain-json consumers
+    # keep working when msgspec is not installed.
+    if _MSGPACK_ENCODER is not None:
+        _replaceAtomically(
+            SNAPSHOT_MP_TMP_PATH,
+            SNAPSHOT_MP_PATH,
+            _MSGPACK_ENCODER.encode(snapshot),
+        )
+
+    _lastSnapshotKey = key
+
+
+def makeInboxWatcher() -> Optional["INotify"]:
+    """
+    Build an inotify watcher over inbox/ and control/, or None when
+    inotify is unavailable (non-Linux, or inotify_simple not installed).
+    """
+    if INotify is None:
+        return None
+
+    try:
+        watcher = INotify()
+        watchFlags = _inotifyFlags.CLOSE_WRITE | _inotifyFlags.MOVED_TO
+        watcher.add_watch(str(INBOX_DIR), watchFlags)
+        watcher.add_watch(str(CONTROL_DIR), watchFlags)
+        return watcher
+    except OSError:
+        return None
+
+
+def sweep(core: SchedulerCore) -> None:
+    """
+    One ingest pass per wakeup: drain the inbox, apply control commands,
+    then publish the resulting snapshot. Keeps the per-tick filesystem
+    work in one place and in a fixed order (new jobs before cancels
+    before the state readers see either).
+    """
+    loadJobsFromInbox(core)
+    handleControlCommands(core)
+    writeStateSnapshot(core)
 
 
 def persistCoreState(core: SchedulerCore, store: SQLiteJobStore) -> None:
@@ -309,9 +648,15 @@ def main() -> None:
         name="gpusched-core",
     )
 
+    shutdownEvent = threading.Event()
+
     def handleShutdown(signum, frame):
-        print("\nShutting down scheduler...")
+        logger.info("Shutting down scheduler...")
+        shutdownEvent.set()
         core.stop()
+        # Wake the serve loop immediately instead of letting it ride out
+        # its current wait timeout.
+        core.stateChanged.set()
 
     signal.signal(signal.SIGINT, handleShutdown)
     signal.signal(signal.SIGTERM, handleShutdown)
@@ -324,7 +669,7 @@ def main() -> None:
                 killRecoveredRunning=args.kill_orphans_on_recover,
             )
             if recovered > 0:
-                print(f"Recovered {recovered} job(s) from {dbPath}")
+                logger.info("Recovered %s job(s) from %s", recovered, dbPath)
 
         store.setDaemonState(
             "daemon",
@@ -337,22 +682,36 @@ def main() -> None:
             },
         )
 
-        print(
-            f"GPU Scheduler daemon starting on GPUs {gpuIndices} "
-            f"(db={dbPath})..."
+        logger.info(
+            "GPU Scheduler daemon starting on GPUs %s (db=%s)...",
+            gpuIndices,
+            dbPath,
         )
         schedulerThread.start()
 
-        while schedulerThread.is_alive():
-            loadJobsFromInbox(core)
-            handleControlCommands(core)
-            writeStateSnapshot(core)
+        # Created once here instead of a mkdir (stat syscall) per poll
+        # inside the loop functions.
+        _resolveDataDirs()
+        for d in (INBOX_DIR, STATE_DIR, CONTROL_DIR):
+            d.mkdir(parents=True, exist_ok=True)
+        watcher = makeInboxWatcher()
+
+        while not shutdownEvent.is_set() and schedulerThread.is_alive():
+            sweep(core)
             persistCoreState(core, store)
             store.setDaemonState(
                 "heartbeat",
                 {"timestamp": time.time()},
             )
-            time.sleep(1)
+            if watcher is not None and not core.stateChanged.is_set():
+                # Event-driven pickup: wakes the moment a submit/cancel
+                # file lands, with the old 1s cadence as the upper bound.
+                watcher.read(timeout=1000)
+            else:
+                # Sleep until the core reports a state change (job
+                # started/finished/preempted) or the 1s heartbeat tick.
+                core.stateChanged.wait(timeout=1.0)
+            core.stateChanged.clear()
 
     finally:
         core.stop()
@@ -371,7 +730,7 @@ def main() -> None:
         )
         store.close()
         releasePidFile(pidFile)
-        print("GPU Scheduler stopped.")
+        logger.info("GPU Scheduler stopped.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,244 @@
+"""
+Regression tests for the queue/snapshot plumbing:
+- Lazy-deletion heap generations and compaction in QueueManager
+- Snapshot change-key skip and per-job dict cache invalidation
+- msgpack mirror freshness fallback in the status CLI
+- Batch cancel semantics on SchedulerCore
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_ROOT = REPO_ROOT / "src"
+if str(SRC_ROOT) not in sys.path:
+    sys.path.insert(0, str(SRC_ROOT))
+
+from gpuscheduler import cli, serve
+from gpuscheduler.daemon.job import Job, JobStatus
+from gpuscheduler.scheduler.core import SchedulerCore
+from gpuscheduler.scheduler.queueManager import QueueManager
+
+
+class QueueManagerHeapTests(unittest.TestCase):
+    def test_removed_jobs_never_resurface(self):
+        qm = QueueManager()
+        jobs = [Job(command=f"cmd {i}", priority=i) for i in range(5)]
+        for job in jobs:
+            qm.addJob(job)
+
+        qm.removeJob(jobs[0].id)
+        qm.removeJob(jobs[2].id)
+
+        queuedIds = [job.id for job in qm.getQueuedJobs()]
+        self.assertEqual(
+            [jobs[1].id, jobs[3].id, jobs[4].id],
+            queuedIds,
+        )
+
+        top = qm.peekHighestPriorityQueued()
+        self.assertIsNotNone(top)
+        self.assertEqual(jobs[1].id, top.id)
+
+    def test_readd_uses_latest_entry_generation(self):
+        qm = QueueManager()
+        jobA = Job(command="a", priority=5)
+        jobB = Job(command="b", priority=3)
+        qm.addJob(jobA)
+        qm.addJob(jobB)
+
+        # Re-adding with a new priority must retire the stale heap entry.
+        qm.removeJob(jobA.id)
+        jobA.priority = 1
+        qm.addJob(jobA)
+
+        top = qm.peekHighestPriorityQueued()
+        self.assertEqual(jobA.id, top.id)
+        queuedIds = [job.id for job in qm.getQueuedJobs()]
+        self.assertEqual([jobA.id, jobB.id], queuedIds)
+
+    def test_heavy_churn_triggers_compaction(self):
+        qm = QueueManager()
+        jobs = [Job(command=f"cmd {i}", priority=i) for i in range(20)]
+        for job in jobs:
+            qm.addJob(job)
+        for job in jobs[:15]:
+            qm.removeJob(job.id)
+
+        # Compaction must have fired along the way: stale entries never
+        # outnumber live ones, so the heap cannot still hold all 20 rows.
+        self.assertLess(len(qm._heap), 20)
+        self.assertLessEqual(qm._staleCount * 2, len(qm._heap))
+        queuedIds = [job.id for job in qm.getQueuedJobs()]
+        self.assertEqual([job.id for job in jobs[15:]], queuedIds)
+
+
+class _SnapshotCore:
+    """Minimal stand-in exposing the snapshot writer's read surface."""
+
+    def __init__(self, queued=None, running=None, terminal=None):
+        self.queued = list(queued or [])
+        self.running = list(running or [])
+        self.terminal = list(terminal or [])
+        self.queueManager = self
+
+    def getQueuedJobs(self, **_kwargs):
+        return list(self.queued)
+
+    def getRunningJobs(self):
+        return list(self.running)
+
+    def getTerminalJobs(self):
+        return list(self.terminal)
+
+
+class SnapshotWriterTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._oldCwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        Path("state").mkdir()
+        serve._lastSnapshotKey = None
+        serve._jobDictCache.clear()
+
+    def tearDown(self):
+        os.chdir(self._oldCwd)
+        self._tmp.cleanup()
+        serve._lastSnapshotKey = None
+        serve._jobDictCache.clear()
+
+    def test_unchanged_state_skips_rewrite(self):
+        job = Job(command="sleep 1")
+        core = _SnapshotCore(queued=[job])
+
+        serve.writeStateSnapshot(core)
+        snapshotPath = Path("state/snapshot.json")
+        self.assertTrue(snapshotPath.exists())
+
+        # Same state: the write must be skipped entirely.
+        snapshotPath.unlink()
+        serve.writeStateSnapshot(core)
+        self.assertFalse(snapshotPath.exists())
+
+    def test_proof_status_change_forces_rewrite(self):
+        job = Job(command="sleep 1", proofStatus="pending")
+        core = _SnapshotCore(queued=[job])
+
+        serve.writeStateSnapshot(core)
+        job.proofStatus = "attestation_denied"
+        serve.writeStateSnapshot(core)
+
+        data = json.loads(Path("state/snapshot.json").read_bytes())
+        self.assertEqual(
+            "attestation_denied",
+            data["queued"][0]["proofStatus"],
+        )
+
+    def test_job_dict_cache_invalidates_on_proof_status(self):
+        job = Job(command="sleep 1", proofStatus="pending")
+
+        first = serve._jobDicts([job])[0]
+        self.assertIs(first, serve._jobDicts([job])[0])
+
+        job.proofStatus = "invalid"
+        refreshed = serve._jobDicts([job])[0]
+        self.assertIsNot(first, refreshed)
+        self.assertEqual("invalid", refreshed["proofStatus"])
+
+    def test_job_dict_cache_prunes_departed_jobs(self):
+        jobA = Job(command="a")
+        jobB = Job(command="b")
+        core = _SnapshotCore(queued=[jobA, jobB])
+
+        # Force the dict-building path regardless of installed codecs.
+        with patch.object(serve, "orjson", None):
+            serve.writeStateSnapshot(core)
+            self.assertIn(jobA.id, serve._jobDictCache)
+            self.assertIn(jobB.id, serve._jobDictCache)
+
+            core.queued = [jobA]
+            serve.writeStateSnapshot(core)
+            self.assertIn(jobA.id, serve._jobDictCache)
+            self.assertNotIn(jobB.id, serve._jobDictCache)
+
+
+class SnapshotMirrorFreshnessTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._oldCwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        Path("state").mkdir()
+
+    def tearDown(self):
+        os.chdir(self._oldCwd)
+        self._tmp.cleanup()
+
+    def test_stale_mirror_is_ignored(self):
+        jsonPayload = {"queued": [], "running": [], "terminal": []}
+        Path("state/snapshot.json").write_text(json.dumps(jsonPayload))
+        Path("state/snapshot.mp").write_bytes(b"mirror")
+
+        mirrorSentinel = {"queued": ["from-mirror"]}
+
+        class _Decoder:
+            def decode(self, _raw):
+                return mirrorSentinel
+
+        jsonMtime = Path("state/snapshot.json").stat().st_mtime
+        with patch.object(cli, "_MSGPACK_DECODER", _Decoder()):
+            # Mirror older than snapshot.json: must fall back to JSON.
+            os.utime("state/snapshot.mp", (jsonMtime - 10, jsonMtime - 10))
+            self.assertEqual(jsonPayload, cli._readSnapshot())
+
+            # Mirror at least as fresh: preferred.
+            os.utime("state/snapshot.mp", (jsonMtime + 10, jsonMtime + 10))
+            self.assertEqual(mirrorSentinel, cli._readSnapshot())
+
+
+class CancelJobsBatchTests(unittest.TestCase):
+    def test_batch_cancel_counts_and_state(self):
+        core = SchedulerCore(gpuIndices=[0])
+        try:
+            jobs = [Job(command=f"cmd {i}", priority=i) for i in range(3)]
+            for job in jobs:
+                core.submitJob(job)
+            core.stateChanged.clear()
+
+            cancelled = core.cancelJobs(
+                [jobs[0].id, jobs[1].id, "missing-id"]
+            )
+
+            self.assertEqual(2, cancelled)
+            self.assertEqual(JobStatus.CANCELLED, jobs[0].status)
+            self.assertEqual(JobStatus.CANCELLED, jobs[1].status)
+            self.assertEqual(JobStatus.QUEUED, jobs[2].status)
+            self.assertTrue(core.stateChanged.is_set())
+
+            queuedIds = [job.id for job in core.queueManager.getQueuedJobs()]
+            self.assertEqual([jobs[2].id], queuedIds)
+
+            terminalIds = {job.id for job in core.getTerminalJobs()}
+            self.assertEqual({jobs[0].id, jobs[1].id}, terminalIds)
+        finally:
+            core.stop()
+
+    def test_empty_batch_is_noop(self):
+        core = SchedulerCore(gpuIndices=[0])
+        try:
+            core.stateChanged.clear()
+            self.assertEqual(0, core.cancelJobs([]))
+            self.assertFalse(core.stateChanged.is_set())
+        finally:
+            core.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()